@@ -1,27 +1,60 @@
 CAMERA_WIDTH = 640
 CAMERA_HEIGHT = 480
+# Largest frame handed to MediaPipe; bigger camera frames are downscaled
+# (aspect kept) before inference. Landmarks are normalized, so they still
+# map straight back to the full-size frame.
+TRACKER_INFERENCE_WIDTH = 320
+TRACKER_INFERENCE_HEIGHT = 240
+# Run hand detection on every Nth camera frame; frames in between reuse the
+# last landmarks (the snake's inertia hides the lower update rate).
+TRACKER_DETECT_EVERY = 2
+# On the skipped frames, extend the fingertip along its motion between the
+# last two detections instead of holding it still.
+TRACKER_EXTRAPOLATE = True
+# MediaPipe Hands model: 0 = lite (much faster on CPU), 1 = full.
+HAND_MODEL_COMPLEXITY = 0
+# In video mode MediaPipe runs the palm detector only until a hand is found,
+# then tracks from the previous landmarks while their score stays above the
+# tracking confidence; detection is re-run only after the track is lost.
+HAND_MIN_DETECTION_CONFIDENCE = 0.7
+HAND_MIN_TRACKING_CONFIDENCE = 0.5
+# Worker threads for OpenCV's own parallel loops in the tracker.
+TRACKER_CV_THREADS = 2
 
 GAME_WIDTH = 800
 GAME_HEIGHT = 600
 FPS = 60
 
 SNAKE_SEGMENT_SIZE = 14
+SNAKE_GRADIENT_BANDS = 4
 INITIAL_LENGTH = 7
 GROWTH_RATE = 2
 FOOD_SIZE = 15
 BONUS_FOOD_SIZE = 20
 
 MIN_DISTANCE_TO_MOVE = 2
+MIN_DISTANCE_TO_MOVE_SQ = MIN_DISTANCE_TO_MOVE * MIN_DISTANCE_TO_MOVE
 MAX_SPEED = 4.0
 
 SEGMENT_SPACING = 5.0
+# While the head stays within this distance of where the body was last
+# respaced (and the length is unchanged) only the head point is moved.
+HEAD_SLIDE_MAX = 0.1 * SEGMENT_SPACING
+HEAD_SLIDE_MAX_SQ = HEAD_SLIDE_MAX * HEAD_SLIDE_MAX
 
 COLLISION_THRESHOLD = 10
+COLLISION_THRESHOLD_SQ = COLLISION_THRESHOLD * COLLISION_THRESHOLD
 SELF_COLLISION_IGNORE = 5
 WALL_COLLISION_MARGIN = 5
+WALL_MIN_X = WALL_COLLISION_MARGIN
+WALL_MAX_X = GAME_WIDTH - WALL_COLLISION_MARGIN
+WALL_MIN_Y = WALL_COLLISION_MARGIN
+WALL_MAX_Y = GAME_HEIGHT - WALL_COLLISION_MARGIN
 
 SMOOTHING_WINDOW = 15
-SMOOTHING_FACTOR = 0.15
+# EMA weight of each new finger sample; 2 / (N + 1) gives the same span as
+# an N-sample moving average.
+SMOOTHING_FACTOR = 2 / (SMOOTHING_WINDOW + 1)
 
 WHITE = (255,255,255)
 BLACK = (0,0,0)
@@ -6,19 +6,29 @@ do::
 	from game import FingerSnakeGame
 
 without importing the heavier submodules at package import time. The lazy
-import avoids circular import problems and keeps import time low.
+import avoids circular import problems and keeps import time low. Submodules
+(``game.audio``, ``game.snake``, ...) are likewise only imported on first
+attribute access.
 """
 
 __version__ = "0.1"
 
 __all__ = ["FingerSnakeGame"]
 
+_SUBMODULES = ("audio", "food", "snake", "tracker", "utils")
+
 def __getattr__(name: str):
 	if name == "FingerSnakeGame":
 		from .utils import FingerSnakeGame
 
 		return FingerSnakeGame
+	if name in _SUBMODULES:
+		import importlib
+
+		# import_module registers the submodule in sys.modules and binds it
+		# on the package, so later lookups never reach this hook again.
+		return importlib.import_module(f".{name}", __name__)
 	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def __dir__():
-	return sorted(__all__)
+	return sorted(__all__ + list(_SUBMODULES))
@@ -1,25 +1,78 @@
-import numpy as np
-import pygame
+# numpy and pygame are imported inside the functions below so that importing
+# this module (or the game package) doesn't pay for them until a sound is made.
+
+# One period of a sine wave; tones are built by indexing into it instead of
+# evaluating np.sin per sample. TBL must be a power of two (phase wraps with &).
+_TBL = 4096
+_SINE_LUT = None
+
+# Attack/release envelope ramps per sample rate (the sustain is flat 1.0).
+_RAMPS = {}
+
+def _lut_sin(cycles):
+    """Return sin(2*pi*cycles) for a float32 array of phases given in cycles."""
+    import numpy as np
+
+    global _SINE_LUT
+    if _SINE_LUT is None:
+        _SINE_LUT = np.sin(2 * np.pi * np.arange(_TBL) / _TBL).astype(np.float32)
+    idx = (cycles * _TBL).astype(np.int32)
+    np.bitwise_and(idx, _TBL - 1, out=idx)
+    return _SINE_LUT[idx]
+
+def _ramps(sample_rate):
+    """Return the cached (attack, release) float32 ramps for sample_rate."""
+    import numpy as np
+
+    ramps = _RAMPS.get(sample_rate)
+    if ramps is None:
+        attack = np.linspace(0, 1, int(0.01 * sample_rate), dtype=np.float32)
+        release = np.linspace(1, 0, int(0.03 * sample_rate), dtype=np.float32)
+        ramps = _RAMPS[sample_rate] = (attack, release)
+    return ramps
+
+def _to_stereo(wave, gain):
+    """Scale a float wave to int16 and duplicate it into an (n, 2) buffer."""
+    import numpy as np
+
+    # Scale and cast in one pass straight into the left channel, then copy
+    # it to the right; no intermediate float or int16 mono array.
+    stereo = np.empty((len(wave), 2), dtype=np.int16)
+    np.multiply(wave, gain, out=stereo[:, 0], casting='unsafe')
+    stereo[:, 1] = stereo[:, 0]
+    return stereo
 
 def make_sine_sound(freq=440, duration=0.12, volume=0.2, sample_rate=44100):
     """Generate a pygame Sound with a sine wave tone."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    wave = 0.5 * np.sin(2 * np.pi * freq * t)
-    env = np.ones_like(wave)
-    env[:int(0.01 * sample_rate)] = np.linspace(0, 1, int(0.01 * sample_rate))
-    env[-int(0.03 * sample_rate):] = np.linspace(1, 0, int(0.03 * sample_rate))
-    wave = wave * env
-    wave = (wave * (2**15 - 1)).astype(np.int16)
-    stereo = np.column_stack([wave, wave])
-    return pygame.sndarray.make_sound(stereo)
+    import numpy as np
+    import pygame
+
+    n = int(sample_rate * duration)
+    t = np.arange(n, dtype=np.float32) / sample_rate
+    wave = _lut_sin(t * freq)
+    wave *= 0.5
+    # Only the attack and release ends are scaled; the sustain is untouched.
+    attack, release = _ramps(sample_rate)
+    wave[:len(attack)] *= attack
+    wave[-len(release):] *= release
+    return pygame.sndarray.make_sound(_to_stereo(wave, 2**15 - 1))
 
 def make_bass_loop(sample_rate=44100):
     """Create a looping ambient bass pad (short looping clip)."""
+    import numpy as np
+    import pygame
+
     duration = 1.0
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    wave = 0.3 * np.sin(2 * np.pi * 55 * t) + 0.15 * np.sin(2 * np.pi * 110 * t * (1 + 0.02*np.sin(2*np.pi*0.2*t)))
-    lfo = 0.8 + 0.2 * np.sin(2 * np.pi * 0.25 * t)
-    wave = wave * lfo
-    wave = (wave * (2**15 - 1) * 0.6).astype(np.int16)
-    stereo = np.column_stack([wave, wave])
-    return pygame.sndarray.make_sound(stereo)
+    n = int(sample_rate * duration)
+    t = np.arange(n, dtype=np.float32) / sample_rate
+    wave = _lut_sin(t * 55)
+    wave *= 0.3
+    wobble = _lut_sin(t * 0.2)
+    wobble *= 0.02
+    wobble += 1
+    wave += 0.15 * _lut_sin(110 * t * wobble)
+    lfo = _lut_sin(t * 0.25)
+    lfo *= 0.2
+    lfo += 0.8
+    wave *= lfo
+    return pygame.sndarray.make_sound(_to_stereo(wave, (2**15 - 1) * 0.6))
@@ -1,6 +1,41 @@
 import pygame, random, math, time
+import numpy as np
+from collections import OrderedDict
 from config import *
 
+# Pre-rendered glow sprites keyed by (color, int_size, glow_intensity, extra).
+# The pulse only spans a few integer sizes, so frames mostly hit the cache;
+# it is kept as a small LRU so color variants can't grow it without bound.
+_GLOW_CACHE = OrderedDict()
+_GLOW_CACHE_SIZE = 32
+
+def _glow_sprite(color, int_size, glow_intensity, extra):
+    """Return the outer glow (stacked translucent circles) as a cached sprite."""
+    key = (color, int_size, glow_intensity, extra)
+    sprite = _GLOW_CACHE.get(key)
+    if sprite is not None:
+        _GLOW_CACHE.move_to_end(key)
+        return sprite
+
+    radius = int_size + extra
+    sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    # One scratch layer for every ring: clear its top-left 2r x 2r corner,
+    # draw the circle there and blit just that area.
+    layer = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    for r in range(radius, int_size, -1):
+        if r <= 0:
+            continue
+        alpha = 255 - (r - int_size) * glow_intensity
+        alpha = int(max(0, min(255, alpha)))
+        area = pygame.Rect(0, 0, r * 2, r * 2)
+        layer.fill((0, 0, 0, 0), area)
+        pygame.draw.circle(layer, (color[0], color[1], color[2], alpha), (r, r), r)
+        sprite.blit(layer, (radius - r, radius - r), area)
+    _GLOW_CACHE[key] = sprite
+    if len(_GLOW_CACHE) > _GLOW_CACHE_SIZE:
+        _GLOW_CACHE.popitem(last=False)
+    return sprite
+
 class Food:
     """Base class for food objects."""
     def __init__(self, color, size, score, boost_duration=0):
@@ -13,84 +48,106 @@ class Food:
         self.respawn_timer = 0.0
         self.cooldown_time = 3.0
         self.pulse_phase = 0.0
+        self.pulse_rate = 1.0
+        self.pulse_depth = 2.0
+        self._pulse_offset = 0.0
         self.is_bonus = False
 
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        self._size = value
+        hit_radius = value + SNAKE_SEGMENT_SIZE // 2
+        self._hit_radius_sq = hit_radius * hit_radius
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = value
+        self._int_pos = (int(value[0]), int(value[1]))
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+        self._int_color = (int(value[0]), int(value[1]), int(value[2]))
+
     def spawn(self):
         """Spawn food at random valid position."""
         x = random.randint(FOOD_SPAWN_MARGIN, GAME_WIDTH - FOOD_SPAWN_MARGIN)
         y = random.randint(FOOD_SPAWN_MARGIN, GAME_HEIGHT - FOOD_SPAWN_MARGIN)
         return (x, y)
 
-    def respawn(self, snake_segments):
+    def respawn(self, snake_segments, now=None):
         """Respawn food at new location avoiding snake."""
+        if now is None:
+            now = time.monotonic()
         self.visible = False
-        self.respawn_timer = time.time() + self.cooldown_time
+        self.respawn_timer = now + self.cooldown_time
         self.pulse_phase = 0.0
+        self._pulse_offset = 0.0
 
-        attempts = 0
-        while attempts < 100:
-            new_pos = self.spawn()
-            valid = True
-            for segment in snake_segments:
-                if math.hypot(new_pos[0] - segment[0], new_pos[1] - segment[1]) < (
-                    SNAKE_SEGMENT_SIZE + self.size + 10
-                ):
-                    valid = False
-                    break
-            if valid:
-                self.position = new_pos
-                self.visible = True
-                return
-            attempts += 1
-        self.position = self.spawn()
+        # Draw all candidates at once and test them against every segment in a
+        # single squared-distance pass (no sqrt, no per-segment Python loop).
+        cands = np.column_stack((
+            np.random.randint(FOOD_SPAWN_MARGIN, GAME_WIDTH - FOOD_SPAWN_MARGIN + 1, size=100),
+            np.random.randint(FOOD_SPAWN_MARGIN, GAME_HEIGHT - FOOD_SPAWN_MARGIN + 1, size=100),
+        ))
+        segs = np.asarray(snake_segments, dtype=np.float32).reshape(-1, 2)
+        pick = 0
+        if len(segs):
+            diff = cands[:, None, :] - segs[None, :, :]
+            min_d2 = (diff * diff).sum(axis=-1).min(axis=1)
+            min_dist = SNAKE_SEGMENT_SIZE + self.size + 10
+            valid = np.flatnonzero(min_d2 >= min_dist * min_dist)
+            if len(valid):
+                pick = valid[0]
+        self.position = (int(cands[pick, 0]), int(cands[pick, 1]))
         self.visible = True
 
-    def update(self):
+    def update(self, now=None):
         """Update food state with animation."""
-        if not self.visible and time.time() >= self.respawn_timer:
+        if now is None:
+            now = time.monotonic()
+        if not self.visible and now >= self.respawn_timer:
             self.visible = True
         self.pulse_phase += 0.12
+        # Computed once per frame here so draw() doesn't re-evaluate sin.
+        self._pulse_offset = math.sin(self.pulse_phase * self.pulse_rate) * self.pulse_depth
 
     def check_collision(self, snake_head):
         """Check if snake head collides with food."""
         if not self.visible:
             return False
-        if math.hypot(snake_head[0] - self.position[0], snake_head[1] - self.position[1]) < (self.size + SNAKE_SEGMENT_SIZE // 2):
-            return True
-        return False
+        dx = snake_head[0] - self._position[0]
+        dy = snake_head[1] - self._position[1]
+        return dx * dx + dy * dy < self._hit_radius_sq
 
     def _safe_glow_draw(self, screen, center_pos, size, base_color, glow_intensity=50, extra=5):
-        """Helper to draw outer glow safely with alpha clamping and zero-size checks."""
-        int_size = int(max(0, round(size)))
-        start_r = int_size + extra
-        end_r = int_size
-        for r in range(start_r, end_r, -1):
-            if r <= 0:
-                continue
-            alpha = 255 - (r - int_size) * glow_intensity
-            alpha = int(max(0, min(255, alpha)))
-            glow_color = (int(base_color[0]), int(base_color[1]), int(base_color[2]), alpha)
-            surf_dim = r * 2
-            if surf_dim <= 0:
-                continue
-            s = pygame.Surface((surf_dim, surf_dim), pygame.SRCALPHA)
-            try:
-                pygame.draw.circle(s, glow_color, (r, r), r)
-                screen.blit(s, (center_pos[0] - r, center_pos[1] - r))
-            except Exception:
-                continue
+        """Helper to draw outer glow from a cached sprite (see _glow_sprite)."""
+        int_size = int(max(0.0, size) + 0.5)
+        sprite = _glow_sprite(base_color, int_size, glow_intensity, extra)
+        radius = int_size + extra
+        screen.blit(sprite, (center_pos[0] - radius, center_pos[1] - radius))
 
     def draw(self, screen):
         """Draw food with pulsing effect."""
         if self.visible:
-            pulse_offset = math.sin(self.pulse_phase) * 2.0
-            size = self.size + pulse_offset
-            int_size = max(1, int(round(size)))
+            size = self.size + self._pulse_offset
+            int_size = max(1, int(size + 0.5))
             if not self.is_bonus:
-                self._safe_glow_draw(screen, self.position, size, self.color, glow_intensity=50, extra=5)
-            core_color = (int(self.color[0]), int(self.color[1]), int(self.color[2]))
-            pygame.draw.circle(screen, core_color, (int(self.position[0]), int(self.position[1])), int_size)
-            pygame.draw.circle(screen, WHITE, (int(self.position[0]), int(self.position[1])), int_size, 2)
+                self._safe_glow_draw(screen, self._int_pos, size, self._int_color, glow_intensity=50, extra=5)
+            pygame.draw.circle(screen, self._int_color, self._int_pos, int_size)
+            pygame.draw.circle(screen, WHITE, self._int_pos, int_size, 2)
 
 
 class RegularFood(Food):
@@ -100,9 +157,9 @@ class RegularFood(Food):
         self.colors = [RED, ORANGE]
         self.color = tuple(random.choice(self.colors))
 
-    def respawn(self, snake_segments):
+    def respawn(self, snake_segments, now=None):
         """Respawn food at new location and change color."""
-        super().respawn(snake_segments)
+        super().respawn(snake_segments, now)
         self.color = tuple(random.choice(self.colors))
 
 
@@ -110,19 +167,18 @@ class BonusFood(Food):
     def __init__(self):
         super().__init__(GOLD, BONUS_FOOD_SIZE, 5, 5.0)
         self.cooldown_time = 10.0
+        self.pulse_rate = 1.5
+        self.pulse_depth = 3.0
         self.is_bonus = True
 
     def draw(self, screen):
         """Draw Bonus Food with a strong glow effect."""
         if self.visible:
-            pulse_offset = math.sin(self.pulse_phase * 1.5) * 3.0
-            size = self.size + pulse_offset
-            int_size = max(1, int(round(size)))
-            self._safe_glow_draw(screen, self.position, size, self.color, glow_intensity=20, extra=10)
-            core_color = (int(self.color[0]), int(self.color[1]), int(self.color[2]))
-            pygame.draw.circle(screen, core_color, (int(self.position[0]), int(self.position[1])), int_size)
-            pygame.draw.circle(screen, WHITE, (int(self.position[0]), int(self.position[1])), int_size, 2)
-            pygame.draw.line(screen, WHITE, (int(self.position[0] - 6), int(self.position[1])), 
-                             (int(self.position[0] + 6), int(self.position[1])), 2)
-            pygame.draw.line(screen, WHITE, (int(self.position[0]), int(self.position[1] - 6)), 
-                             (int(self.position[0]), int(self.position[1] + 6)), 2)
+            size = self.size + self._pulse_offset
+            int_size = max(1, int(size + 0.5))
+            self._safe_glow_draw(screen, self._int_pos, size, self._int_color, glow_intensity=20, extra=10)
+            px, py = self._int_pos
+            pygame.draw.circle(screen, self._int_color, self._int_pos, int_size)
+            pygame.draw.circle(screen, WHITE, self._int_pos, int_size, 2)
+            pygame.draw.line(screen, WHITE, (px - 6, py), (px + 6, py), 2)
+            pygame.draw.line(screen, WHITE, (px, py - 6), (px, py + 6), 2)
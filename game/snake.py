@@ -1,14 +1,34 @@
-from collections import deque
-import time, math
-from config import *
-import pygame
-
-class Snake:
-    """Snake game logic with smooth following behavior."""
-from collections import deque
 import time, math
+import numpy as np
 from config import *
 import pygame
+from collections import OrderedDict
+
+# Pre-rendered joint circles (fill + outline) keyed by (color, outline, size).
+# Joints are colored per gradient band, so a palette needs only a handful;
+# the boost pulse changes the palette every frame, hence the small LRU.
+_JOINT_CACHE = OrderedDict()
+_JOINT_CACHE_SIZE = 32
+
+def _joint_sprite(color, outline, size):
+    """Return a cached SRCALPHA sprite of one body joint, 2*size square."""
+    key = (color, outline, size)
+    sprite = _JOINT_CACHE.get(key)
+    if sprite is not None:
+        _JOINT_CACHE.move_to_end(key)
+        return sprite
+
+    sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (size, size), size)
+    pygame.draw.circle(sprite, outline, (size, size), size, 2)
+    # Match the display's pixel format so blits of it take the fast path
+    # (only possible once a display mode is set).
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert_alpha()
+    _JOINT_CACHE[key] = sprite
+    if len(_JOINT_CACHE) > _JOINT_CACHE_SIZE:
+        _JOINT_CACHE.popitem(last=False)
+    return sprite
 
 class Snake:
     """Snake game logic with smooth following behavior."""
@@ -21,35 +41,68 @@ class Snake:
         center_x = GAME_WIDTH // 2
         center_y = GAME_HEIGHT // 2
 
-        self.segments = deque([
-            (center_x - i * SEGMENT_SPACING, center_y) for i in range(INITIAL_LENGTH)
-        ])
+        # Segments live in a preallocated (capacity, 2) buffer; only the
+        # first self._n rows are part of the snake (head first). The buffer
+        # (already grown to the last game's length) is kept across resets.
+        if not hasattr(self, '_seg'):
+            self._seg = np.zeros((0, 2), dtype=np.float32)
+            self._reserve(max(64, INITIAL_LENGTH * 2))
+        self._seg[:INITIAL_LENGTH, 0] = center_x - np.arange(INITIAL_LENGTH) * SEGMENT_SPACING
+        self._seg[:INITIAL_LENGTH, 1] = center_y
+        self._n = INITIAL_LENGTH
         self.growth_pending = 0
         self.velocity = (0.0, 0.0)
         self.speed_boost_end_time = 0.0
-
-    def get_max_speed(self):
-        """Return the current max speed, including boost."""
-        if time.time() < self.speed_boost_end_time:
+        self._color_lut_key = None
+        self._color_lut_cache = None
+        # Target that last landed in the dead zone; see update().
+        self._idle_target = None
+        # Unit heading used for the eyes; the body starts out to the left.
+        self._head_dir = (1.0, 0.0)
+        # Head position at the last full respace; see update().
+        self._anchor = (float(center_x), float(center_y))
+
+    @property
+    def segments(self):
+        """(n, 2) float32 view of the segment positions, head first."""
+        return self._seg[:self._n]
+
+    def get_max_speed(self, now=None):
+        """Return the current max speed, including boost.
+
+        `now` is the caller's per-frame timestamp; time.monotonic() if omitted.
+        """
+        if now is None:
+            now = time.monotonic()
+        if now < self.speed_boost_end_time:
             return MAX_SPEED * 1.5
         return MAX_SPEED
 
-    def activate_boost(self, duration=3.0):
+    def activate_boost(self, duration=3.0, now=None):
         """Activate temporary speed boost."""
-        self.speed_boost_end_time = time.time() + duration
+        if now is None:
+            now = time.monotonic()
+        self.speed_boost_end_time = now + duration
 
-    def update(self, target_pos):
+    def update(self, target_pos, now=None):
         """Update snake position with smooth, natural movement maintaining spacing."""
         if target_pos:
-            head = self.segments[0]
+            # The head only moves here, so if the target is the one that was
+            # already inside the dead zone, nothing can have changed.
+            if target_pos == self._idle_target:
+                return
+            head = self._seg[0].tolist()
 
             dx = target_pos[0] - head[0]
             dy = target_pos[1] - head[1]
-            distance = math.hypot(dx, dy)
-            current_max_speed = self.get_max_speed()
-
-            if distance < MIN_DISTANCE_TO_MOVE:
+            # Dead-zone test on the squared distance; sqrt only when moving.
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < MIN_DISTANCE_TO_MOVE_SQ:
+                self._idle_target = target_pos
                 return
+            self._idle_target = None
+            distance = math.sqrt(dist_sq)
+            current_max_speed = self.get_max_speed(now)
 
             if distance > 0:
                 dir_x = dx / distance
@@ -72,50 +125,99 @@ class Snake:
                     head[1] + self.velocity[1]
                 )
 
-                self.segments.appendleft(new_head)
-
-                segments_to_keep = []
-                segments_to_keep.append(self.segments[0])
-
-                for i in range(1, len(self.segments)):
-                    prev_seg = segments_to_keep[-1]
-                    curr_seg = self.segments[i]
-
-                    dx_s = curr_seg[0] - prev_seg[0]
-                    dy_s = curr_seg[1] - prev_seg[1]
-                    dist = math.hypot(dx_s, dy_s)
-
-                    if dist >= SEGMENT_SPACING:
-                        if dist > 0:
-                            ratio = SEGMENT_SPACING / dist
-                            new_x = prev_seg[0] + dx_s * ratio
-                            new_y = prev_seg[1] + dy_s * ratio
-                            segments_to_keep.append((new_x, new_y))
-
-                self.segments = deque(segments_to_keep)
-
+                # Tiny steps with no length change only slide the head point;
+                # the body is respaced once the head drifts HEAD_SLIDE_MAX
+                # away from where it was last respaced.
                 target_length = INITIAL_LENGTH + self.growth_pending
+                slide_x = new_head[0] - self._anchor[0]
+                slide_y = new_head[1] - self._anchor[1]
+                if (target_length == self._n
+                        and slide_x * slide_x + slide_y * slide_y < HEAD_SLIDE_MAX_SQ):
+                    self._seg[0] = new_head
+                    self._track_heading()
+                    return
+
+                self._respace(new_head, target_length)
+                self._anchor = new_head
+                self._track_heading()
+
+    def _track_heading(self):
+        """Point _head_dir from the neck to the head (the way it is moving)."""
+        if self._n < 2:
+            return
+        hx, hy = self._seg[0].tolist()
+        nx, ny = self._seg[1].tolist()
+        dx = hx - nx
+        dy = hy - ny
+        length_sq = dx * dx + dy * dy
+        # Head on top of the neck: keep the previous heading.
+        if length_sq > 1e-6:
+            length = math.sqrt(length_sq)
+            self._head_dir = (dx / length, dy / length)
+
+    def _reserve(self, size):
+        """Make room for at least `size` segments (plus the pushed-in head).
+
+        Grows the segment buffer and the scratch arrays used by _respace
+        together, doubling so reallocation is rare.
+        """
+        capacity = len(self._seg)
+        if size < capacity:
+            return
+        capacity = max(size + 1, capacity * 2)
+        seg = np.zeros((capacity, 2), dtype=np.float32)
+        seg[:len(self._seg)] = self._seg
+        self._seg = seg
+        self._step = np.empty((capacity, 2), dtype=np.float32)
+        self._int_seg = np.empty((capacity, 2), dtype=np.int32)
+        self._arc = np.empty(capacity, dtype=np.float64)
+        self._arc[0] = 0.0
+        self._sample_arc = np.arange(capacity) * SEGMENT_SPACING
+
+    def _respace(self, new_head, target_length):
+        """Resample the path (new head + old body) every SEGMENT_SPACING px."""
+        n = self._n
+        self._reserve(max(n + 1, target_length))
+
+        # Push the new head in front of the body in place; path is a view.
+        seg = self._seg
+        seg[1:n + 1] = seg[:n]
+        seg[0] = new_head
+        path = seg[:n + 1]
+
+        step = self._step[:n]
+        np.subtract(path[1:], path[:-1], out=step)
+        np.multiply(step, step, out=step)
+        seg_len = step[:, 0]
+        np.add(seg_len, step[:, 1], out=seg_len)
+        np.sqrt(seg_len, out=seg_len)
+        arc = self._arc[:n + 1]
+        np.cumsum(seg_len, out=arc[1:])
+
+        t = self._sample_arc[:target_length]
+        xs = np.interp(t, arc, path[:, 0])
+        ys = np.interp(t, arc, path[:, 1])
+
+        # Growth: samples past the end of the path extend along the tail
+        # direction (straight down if the tail is degenerate).
+        total = arc[-1]
+        if t[-1] > total:
+            tail_x, tail_y = path[-1].tolist()
+            tail_dx = tail_x - float(path[-2, 0])
+            tail_dy = tail_y - float(path[-2, 1])
+            tail_len = math.sqrt(tail_dx * tail_dx + tail_dy * tail_dy)
+            if tail_len > 0:
+                ux, uy = tail_dx / tail_len, tail_dy / tail_len
+            else:
+                ux, uy = 0.0, 1.0
+            first = int(np.searchsorted(t, total, side='right'))
+            extra = t[first:] - total
+            xs[first:] = tail_x + ux * extra
+            ys[first:] = tail_y + uy * extra
 
-                while len(self.segments) < target_length:
-                    if len(self.segments) >= 2:
-                        tail = self.segments[-1]
-                        prev = self.segments[-2]
-                        dx_t = tail[0] - prev[0]
-                        dy_t = tail[1] - prev[1]
-                        dist = math.hypot(dx_t, dy_t)
-
-                        if dist > 0:
-                            new_x = tail[0] + (dx_t / dist) * SEGMENT_SPACING
-                            new_y = tail[1] + (dy_t / dist) * SEGMENT_SPACING
-                            self.segments.append((new_x, new_y))
-                        else:
-                            self.segments.append((tail[0], tail[1] + SEGMENT_SPACING))
-                    else:
-                        tail = self.segments[-1]
-                        self.segments.append((tail[0], tail[1] + SEGMENT_SPACING))
-
-                while len(self.segments) > target_length:
-                    self.segments.pop()
+        seg[:target_length, 0] = xs
+        seg[:target_length, 1] = ys
+        self._n = target_length
 
     def grow(self, amount=GROWTH_RATE):
         """Add growth to snake."""
@@ -123,102 +225,121 @@ class Snake:
 
     def check_self_collision(self):
         """Check if snake head collides with its body."""
-        if len(self.segments) <= SELF_COLLISION_IGNORE:
+        if self._n <= SELF_COLLISION_IGNORE:
             return False
 
-        head = self.segments[0]
-        for segment in list(self.segments)[SELF_COLLISION_IGNORE:]:
-            if math.hypot(head[0] - segment[0], head[1] - segment[1]) < COLLISION_THRESHOLD:
-                return True
-        return False
+        # One squared-distance pass over the collidable body, reusing the
+        # _respace scratch buffer for the head-relative offsets.
+        body = self._seg[SELF_COLLISION_IGNORE:self._n]
+        diff = self._step[:len(body)]
+        np.subtract(body, self._seg[0], out=diff)
+        return bool((np.einsum('ij,ij->i', diff, diff) < COLLISION_THRESHOLD_SQ).any())
 
     def check_wall_collision(self):
         """Check if snake head collides with the game boundary."""
-        head = self.segments[0]
-        x, y = head
-
-        if (x < WALL_COLLISION_MARGIN or x > GAME_WIDTH - WALL_COLLISION_MARGIN or
-            y < WALL_COLLISION_MARGIN or y > GAME_HEIGHT - WALL_COLLISION_MARGIN):
-            return True
-        return False
-
-    def draw(self, screen):
+        hx, hy = self._seg[0].tolist()
+        return not (WALL_MIN_X <= hx <= WALL_MAX_X and WALL_MIN_Y <= hy <= WALL_MAX_Y)
+
+    def _color_lut(self, base_color, base_outline, length):
+        """Return per-segment (body, dark, joint) colors and the head color.
+
+        The gradient only depends on the palette and the snake length, so the
+        table is rebuilt only when one of those changes (every frame while the
+        boost pulse is animating the palette).
+        """
+        key = (base_color, base_outline, length)
+        if self._color_lut_key == key:
+            return self._color_lut_cache
+
+        # Whole table in a few array ops; same float64 arithmetic and int
+        # truncation as the per-segment formula it replaced.
+        brightness = (1.0 - (np.arange(length) / length) * 0.4)[:, None]
+        base = np.array(base_color, dtype=np.float64)
+        joint = np.minimum(255, (base * brightness).astype(np.int64))
+        lift = np.array([50.0, 100.0, 50.0]) * brightness
+        body = np.minimum(255, (base * brightness + lift).astype(np.int64))
+        dark = (body * 0.5).astype(np.int64)
+        body_colors = list(map(tuple, body.tolist()))
+        dark_colors = list(map(tuple, dark.tolist()))
+        joint_colors = list(map(tuple, joint.tolist()))
+        head_color = (min(255, int(base_outline[0])), min(255, int(base_outline[1])),
+                      min(255, int(base_outline[2])))
+
+        self._color_lut_key = key
+        self._color_lut_cache = (body_colors, dark_colors, joint_colors, head_color)
+        return self._color_lut_cache
+
+    def draw(self, screen, now=None):
         """Draw snake with a gradient effect."""
-        segments_list = [(int(x), int(y)) for x, y in self.segments] # Convert to int for drawing
+        # Truncate to int pixels in one cast into a reused buffer; tolist()
+        # then yields plain Python ints for the pygame calls.
+        ints = self._int_seg[:self._n]
+        np.copyto(ints, self.segments, casting='unsafe')
+        segments_list = ints.tolist()
 
         if len(segments_list) < 2:
             return
 
-        if time.time() < self.speed_boost_end_time:
-            pulse = (math.sin(time.time() * 20) * 0.1) + 1.0 
+        if now is None:
+            now = time.monotonic()
+        if now < self.speed_boost_end_time:
+            pulse = (math.sin(now * 20) * 0.1) + 1.0
             base_color = (int(GOLD[0] * pulse), int(GOLD[1] * pulse), int(GOLD[2] * pulse))
             base_outline = GOLD
         else:
             base_color = DARK_GREEN
             base_outline = GREEN
 
-        for i in range(len(segments_list) - 1):
-            start_pos = segments_list[i]
-            end_pos = segments_list[i + 1]
-
-            brightness_factor = 1.0 - (i / len(segments_list)) * 0.4
-
-            body_color = (
-                min(255, int(base_color[0] * brightness_factor + 50 * brightness_factor)),
-                min(255, int(base_color[1] * brightness_factor + 100 * brightness_factor)),
-                min(255, int(base_color[2] * brightness_factor + 50 * brightness_factor))
-            )
-
-            thickness = SNAKE_SEGMENT_SIZE - 2
-            pygame.draw.line(screen, body_color, start_pos, end_pos, thickness)
-
-            dark_color = (
-                int(body_color[0] * 0.5),
-                int(body_color[1] * 0.5),
-                int(body_color[2] * 0.5)
-            )
-            pygame.draw.line(screen, dark_color, start_pos, end_pos, max(1, thickness // 3))
-
-        for i, segment in enumerate(segments_list):
-            brightness_factor = 1.0 - (i / len(segments_list)) * 0.4
-
-            if i == 0:
-                head_color = (
-                    min(255, int(base_outline[0] * brightness_factor)),
-                    min(255, int(base_outline[1] * brightness_factor)),
-                    min(255, int(base_outline[2] * brightness_factor))
-                )
-
-                pygame.draw.circle(screen, head_color, segment, SNAKE_SEGMENT_SIZE)
-                pygame.draw.circle(screen, base_outline, segment, SNAKE_SEGMENT_SIZE, 3)
-
-                eye_x, eye_y = segment
-                if len(segments_list) > 1:
-                    next_seg = segments_list[1]
-                    angle = math.atan2(eye_y - next_seg[1], eye_x - next_seg[0])
-                else:
-                    angle = -math.pi / 2 # Default up
-
-                offset = 4
-                eye_dx = offset * math.cos(angle)
-                eye_dy = offset * math.sin(angle)
-
-                eye1_x = eye_x + eye_dy - 2
-                eye1_y = eye_y - eye_dx - 2
-                eye2_x = eye_x - eye_dy + 2
-                eye2_y = eye_y + eye_dx + 2
-
-                pygame.draw.circle(screen, WHITE, (int(eye1_x), int(eye1_y)), 3)
-                pygame.draw.circle(screen, WHITE, (int(eye2_x), int(eye2_y)), 3)
-                pygame.draw.circle(screen, BLACK, (int(eye1_x), int(eye1_y)), 1)
-                pygame.draw.circle(screen, BLACK, (int(eye2_x), int(eye2_y)), 1)
-
-            else:
-                size = max(1, SNAKE_SEGMENT_SIZE - 4)
-                joint_color = (
-                    min(255, int(base_color[0] * brightness_factor)),
-                    min(255, int(base_color[1] * brightness_factor)),
-                    min(255, int(base_color[2] * brightness_factor))
-                )
-                pygame.draw.circle(screen, joint_color, segment, size)
-                pygame.draw.circle(screen, base_outline, segment, size, 2)
+        body_colors, dark_colors, joint_colors, head_color = self._color_lut(
+            base_color, base_outline, len(segments_list))
+
+        # Body as a few polylines, one per brightness band (colored by the
+        # band's middle segment), instead of two draw.line calls per segment.
+        thickness = SNAKE_SEGMENT_SIZE - 2
+        n_lines = len(segments_list) - 1
+        bands = min(SNAKE_GRADIENT_BANDS, n_lines)
+        for band in range(bands):
+            start = band * n_lines // bands
+            end = (band + 1) * n_lines // bands
+            points = segments_list[start:end + 1]
+            mid = (start + end - 1) // 2
+            pygame.draw.lines(screen, body_colors[mid], False, points, thickness)
+            pygame.draw.lines(screen, dark_colors[mid], False, points, max(1, thickness // 3))
+
+        head = segments_list[0]
+        pygame.draw.circle(screen, head_color, head, SNAKE_SEGMENT_SIZE)
+        pygame.draw.circle(screen, base_outline, head, SNAKE_SEGMENT_SIZE, 3)
+
+        # The unit neck->head heading cached by update() is cos/sin of the
+        # head angle, so the eyes need no atan2/sin/cos (or even a sqrt) here.
+        eye_x, eye_y = head
+        cos_a, sin_a = self._head_dir
+
+        offset = 4
+        eye_dx = offset * cos_a
+        eye_dy = offset * sin_a
+
+        eye1_x = eye_x + eye_dy - 2
+        eye1_y = eye_y - eye_dx - 2
+        eye2_x = eye_x - eye_dy + 2
+        eye2_y = eye_y + eye_dx + 2
+
+        pygame.draw.circle(screen, WHITE, (int(eye1_x), int(eye1_y)), 3)
+        pygame.draw.circle(screen, WHITE, (int(eye2_x), int(eye2_y)), 3)
+        pygame.draw.circle(screen, BLACK, (int(eye1_x), int(eye1_y)), 1)
+        pygame.draw.circle(screen, BLACK, (int(eye2_x), int(eye2_y)), 1)
+
+        # Joints are blitted from cached sprites, one per band (same bands
+        # and band colors as the body polylines above), in a single blits()
+        # call rather than one screen.blit per segment.
+        size = max(1, SNAKE_SEGMENT_SIZE - 4)
+        joints = []
+        for band in range(bands):
+            start = band * n_lines // bands
+            end = (band + 1) * n_lines // bands
+            mid = (start + end - 1) // 2
+            sprite = _joint_sprite(joint_colors[mid], base_outline, size)
+            last = end + 1 if band == bands - 1 else end
+            joints += [(sprite, (x - size, y - size))
+                       for x, y in segments_list[max(1, start):last]]
+        screen.blits(joints, False)
@@ -1,49 +1,120 @@
-import cv2, math
+import cv2
+import numpy as np
 import mediapipe as mp
+from config import *
 
 class HandTracker:
     """Handles hand tracking using MediaPipe with enhanced stability."""
 
     def __init__(self):
+        # OpenCV's resize/cvtColor on these small frames don't benefit from a
+        # full-width thread pool; keep it small so it doesn't compete with
+        # MediaPipe and the render thread for cores.
+        cv2.setNumThreads(TRACKER_CV_THREADS)
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5,
-            model_complexity=1
+            min_detection_confidence=HAND_MIN_DETECTION_CONFIDENCE,
+            min_tracking_confidence=HAND_MIN_TRACKING_CONFIDENCE,
+            model_complexity=HAND_MODEL_COMPLEXITY
         )
         self.prev_position = None
 
-    def find_finger_position(self, frame, draw_labels=True):
+        # The default styles are rebuilt on every call to their getters, so
+        # build them once; draw_landmarks only reads them.
+        self._landmark_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+        self._connection_style = self.mp_drawing_styles.get_default_hand_connections_style()
+
+        # Scratch frames for the downscaled BGR and RGB inference input,
+        # (re)allocated only when the camera frame size changes.
+        self._small_buf = None
+        self._rgb_buf = None
+
+        self.detect_every = TRACKER_DETECT_EVERY
+        self._frame_counter = 0
+        self._last_results = None
+        # Fingertip (pixels) at the last two detections, and frames since the
+        # last one, for extrapolating on skipped frames.
+        self._tip = None
+        self._tip_prev = None
+        self._since_detect = 0
+
+    def _detect(self, frame, h, w):
+        """Run MediaPipe on a (possibly downscaled) RGB copy of frame."""
+        scale = min(TRACKER_INFERENCE_WIDTH / w, TRACKER_INFERENCE_HEIGHT / h)
+        if scale < 1.0:
+            # Inference cost scales with pixel count; drawing stays on `frame`.
+            # INTER_AREA has a fast path for the common 2x case and doesn't
+            # alias fine detail the way bilinear does on large reductions.
+            size = (int(w * scale), int(h * scale))
+            if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                self._small_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            small = cv2.resize(frame, size, dst=self._small_buf,
+                               interpolation=cv2.INTER_AREA)
+        else:
+            small = frame
+        if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+            self._rgb_buf = np.empty_like(small)
+        # The scratch buffer is C-contiguous, so the binding can hand it to
+        # the graph without making its own copy first.
+        frame_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        return self.hands.process(frame_rgb)
+
+    def find_finger_position(self, frame, draw_labels=True, draw_overlays=True):
         """Extract index finger tip position from frame with hand landmarks drawn.
 
         If draw_labels is False, the tracker will not write textual labels onto the
         frame (e.g. "INDEX" / "NO HAND DETECTED"). This lets the caller draw
         labels separately (for example, to control mirroring of labels).
+
+        If draw_overlays is False nothing is drawn on the frame at all (no
+        landmarks, fingertip circle or labels), for callers that only need
+        the position.
         """
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(frame_rgb)
+        draw_labels = draw_labels and draw_overlays
+        h, w, _ = frame.shape
+        fresh = self._last_results is None or self._frame_counter % self.detect_every == 0
+        if fresh:
+            results = self._detect(frame, h, w)
+            self._last_results = results
+            self._since_detect = 0
+        else:
+            # Skipped frame: reuse the last landmarks so the preview still
+            # shows the hand; the fingertip is extrapolated below.
+            results = self._last_results
+            self._since_detect += 1
+        self._frame_counter += 1
 
         if results.multi_hand_landmarks:
             hand_landmarks = results.multi_hand_landmarks[0]
-            self.mp_drawing.draw_landmarks(
-                frame,
-                hand_landmarks,
-                self.mp_hands.HAND_CONNECTIONS,
-                self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                self.mp_drawing_styles.get_default_hand_connections_style()
-            )
+            if draw_overlays:
+                self.mp_drawing.draw_landmarks(
+                    frame,
+                    hand_landmarks,
+                    self.mp_hands.HAND_CONNECTIONS,
+                    self._landmark_style,
+                    self._connection_style
+                )
 
             index_finger = hand_landmarks.landmark[8]
 
-            h, w, _ = frame.shape
             x = int(index_finger.x * w)
             y = int(index_finger.y * h)
+            if fresh:
+                self._tip_prev = self._tip
+                self._tip = (x, y)
+            elif TRACKER_EXTRAPOLATE and self._tip_prev is not None:
+                # Continue the motion between the last two detections, which
+                # were detect_every frames apart.
+                k = self._since_detect / self.detect_every
+                x = int(x + (self._tip[0] - self._tip_prev[0]) * k)
+                y = int(y + (self._tip[1] - self._tip_prev[1]) * k)
 
-            cv2.circle(frame, (x, y), 10, (0, 255, 0), -1)
+            if draw_overlays:
+                cv2.circle(frame, (x, y), 10, (0, 255, 0), -1)
             if draw_labels:
                 cv2.putText(frame, "INDEX", (x + 15, y), cv2.FONT_HERSHEY_SIMPLEX, 
                             0.5, (0, 255, 0), 2)
@@ -51,14 +122,20 @@ class HandTracker:
             new_pos = (x, y)
 
             if self.prev_position is not None:
-                dist = math.hypot(new_pos[0] - self.prev_position[0], 
-                                  new_pos[1] - self.prev_position[1])
-                if dist > 200:
+                # Reject jumps over 200 px (compared squared, no sqrt).
+                jump_x = new_pos[0] - self.prev_position[0]
+                jump_y = new_pos[1] - self.prev_position[1]
+                if jump_x * jump_x + jump_y * jump_y > 200 * 200:
                     return self.prev_position, True, frame
 
             self.prev_position = new_pos
             return new_pos, True, frame
 
+        if fresh:
+            # Don't extrapolate across a gap in detection
+            self._tip = None
+            self._tip_prev = None
+
         if draw_labels:
             cv2.putText(frame, "NO HAND DETECTED", (10, 30), 
                         cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
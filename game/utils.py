@@ -7,12 +7,16 @@ from config import *
 from game.snake import Snake
 from game.food import RegularFood, BonusFood
 from game.tracker import HandTracker
-from collections import deque
 import random
 import os
+from collections import OrderedDict
 import json
 from game.audio import make_sine_sound, make_bass_loop
 
+# Rendered text surfaces are cached (LRU) by font, string and color; HUD
+# strings only change when their value does.
+_TEXT_CACHE_SIZE = 200
+
 class FingerSnakeGame:
     """Main game controller with ultra-smooth tracking."""
 
@@ -20,9 +24,22 @@ class FingerSnakeGame:
         pygame.init()
         # Window includes game board (GAME_WIDTH) plus an information panel on the right
         total_width = GAME_WIDTH + INFO_PANEL_WIDTH
-        self.screen = pygame.display.set_mode((total_width, GAME_HEIGHT))
+        # Prefer a vsynced SCALED window so presentation is paced by the
+        # display; not every driver can provide vsync, so fall back to a
+        # plain window (clock.tick(FPS) still caps the loop either way).
+        try:
+            self.screen = pygame.display.set_mode((total_width, GAME_HEIGHT),
+                                                  pygame.SCALED, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((total_width, GAME_HEIGHT))
         pygame.display.set_caption("Finger-Controlled Snake")
         self.clock = pygame.time.Clock()
+        # Full-screen translucent layers, filled once and just blitted: the
+        # red collision flash and the dark backdrop of the quit modal.
+        self._flash_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._flash_surface.fill((255, 0, 0, 100))
+        self._modal_overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._modal_overlay.fill((0, 0, 0, 160))
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         # Tiny font for compact labels inside camera preview
@@ -47,7 +64,11 @@ class FingerSnakeGame:
 
         # Game objects
         self.snake = Snake()
-        self.foods = [RegularFood()]
+        # One instance of each food kind, reused: respawn() fully resets
+        # position, colour, visibility and pulse.
+        self._regular_food = RegularFood()
+        self._bonus_food = BonusFood()
+        self.foods = [self._regular_food]
         self.score = 0
         self.game_state = "MENU"
         self.flash_timer = 0 # For collision feedback
@@ -56,26 +77,47 @@ class FingerSnakeGame:
         self.hand_tracker = HandTracker()
         self.last_finger_pos = None
         self.finger_detected = False
-
-        # Multi-level smoothing
+        # This frame's snapshot of the camera thread's finger position (None
+        # when it has none); taken under the lock in update_from_shared_state
+        self.finger_pos = None
+
+        # Mirroring options are optional in config; resolve them once here
+        # rather than probing globals() on every camera/render frame.
+        self._mirror = bool(globals().get('CAMERA_MIRROR', False))
+        self._mirror_text_only = bool(globals().get('CAMERA_MIRROR_TEXT_ONLY', False))
+
+        # Camera -> game mapping constants (scale factors and clamp bounds)
+        self._map_sx = GAME_WIDTH / CAMERA_WIDTH if CAMERA_WIDTH else 1.0
+        self._map_sy = GAME_HEIGHT / CAMERA_HEIGHT if CAMERA_HEIGHT else 1.0
+        self._map_mirror_w = CAMERA_WIDTH if self._mirror else 0
+        self._map_max_x = GAME_WIDTH - SNAKE_SEGMENT_SIZE
+        self._map_max_y = GAME_HEIGHT - SNAKE_SEGMENT_SIZE
+
+        # Finger smoothing (EMA)
         self.smooth_pos = None
         self.smoothing_factor = SMOOTHING_FACTOR
-        self.position_history = deque(maxlen=SMOOTHING_WINDOW)
 
         # Camera / threading setup
         self.cap = cv2.VideoCapture(0)
+        self.cap_buffer_limited = False
         # Check if camera opened successfully
         if not self.cap.isOpened():
             print("Warning: Could not open camera. Running without camera input.")
             self.running = True
             self.cap = None
         else:
+            # Ask for MJPG before the resolution (V4L2 picks modes per format);
+            # backends that can't do it just ignore the request.
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
             self.cap.set(cv2.CAP_PROP_FPS, 30)
+            # Keep only the newest frame queued so read() isn't several
+            # frames stale. Not every backend supports it (set() -> False).
+            self.cap_buffer_limited = bool(self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1))
 
         self.frame_lock = threading.Lock()
-        self.latest_frame_small = None
+        self.latest_camera_surface = None
         self.latest_overlay_text = None
         self.latest_overlay_pos = None
         self.latest_overlay_detected = False
@@ -83,12 +125,27 @@ class FingerSnakeGame:
         self.shared_finger_detected = False
 
         self.running = True
+        # Set on shutdown; the camera thread checks it every frame and waits
+        # on it instead of sleeping, so it exits without an extra delay.
+        self._stop = threading.Event()
         self.camera_thread = None
         if self.cap is not None:
             self.camera_thread = threading.Thread(target=self.camera_loop, daemon=True)
             self.camera_thread.start()
 
         self.camera_surface = None
+        self._camera_display = None
+        # Screen regions presented while paused (see run())
+        self._info_rect = pygame.Rect(GAME_WIDTH, 0, INFO_PANEL_WIDTH, GAME_HEIGHT)
+        self._pause_rect = pygame.Rect(0, 0, 0, 0)
+        self._grid_tile = None
+        self._grid_tile_origins = None
+        self._text_cache = OrderedDict()
+        # FPS label shared by the HUD and the game-area counter (see _fps_label)
+        self._fps_text = "FPS: 0"
+        self._fps_next_update = 0.0
+        # Timestamp shared by everything drawn/updated in the current frame.
+        self.frame_now = time.monotonic()
 
         # Transition timers
         self.menu_detect_start = None
@@ -96,13 +153,16 @@ class FingerSnakeGame:
         self.transition_delay = 0.5
 
         # Bonus Food Management
-        self.bonus_food_spawn_timer = time.time() + 15.0 # First bonus food after 15s
+        self.bonus_food_spawn_timer = time.monotonic() + 15.0 # First bonus food after 15s
 
         # UI / control flags
         self.paused = False
         self.muted = False
         # Exit confirmation flag — when True, user must confirm quit with Y
         self.exit_confirmation = False
+        # Message box of the quit modal, built on first use
+        self._exit_box = None
+        self._exit_box_pos = None
 
         # High score persistence
         
@@ -153,57 +213,74 @@ class FingerSnakeGame:
         except Exception:
             pass
 
+    def _play(self, name):
+        """Play a sound effect unless muted or it failed to load."""
+        if self.muted:
+            return
+        # Sounds only exist if the mixer came up in __init__, so play()
+        # needs no exception guard here.
+        sound = self.sounds.get(name)
+        if sound is not None:
+            sound.play()
+
     def map_coordinates(self, camera_pos):
         """Map camera coordinates to game coordinates."""
         x, y = camera_pos
         # Mirror only if configured to do so (keeps mapping consistent with preview)
-        if 'CAMERA_MIRROR' in globals() and CAMERA_MIRROR and CAMERA_WIDTH:
-            x = CAMERA_WIDTH - x
-        game_x = int(x * GAME_WIDTH / CAMERA_WIDTH) if CAMERA_WIDTH else int(x)
-        game_y = int(y * GAME_HEIGHT / CAMERA_HEIGHT) if CAMERA_HEIGHT else int(y)
+        if self._map_mirror_w:
+            x = self._map_mirror_w - x
+        game_x = int(x * self._map_sx)
+        game_y = int(y * self._map_sy)
         # Clamp to game boundaries
-        game_x = max(SNAKE_SEGMENT_SIZE, min(GAME_WIDTH - SNAKE_SEGMENT_SIZE, game_x))
-        game_y = max(SNAKE_SEGMENT_SIZE, min(GAME_HEIGHT - SNAKE_SEGMENT_SIZE, game_y))
+        if game_x < SNAKE_SEGMENT_SIZE:
+            game_x = SNAKE_SEGMENT_SIZE
+        elif game_x > self._map_max_x:
+            game_x = self._map_max_x
+        if game_y < SNAKE_SEGMENT_SIZE:
+            game_y = SNAKE_SEGMENT_SIZE
+        elif game_y > self._map_max_y:
+            game_y = self._map_max_y
         return (game_x, game_y)
 
     def smooth_position(self, new_pos):
-        """Advanced multi-stage smoothing."""
+        """Exponential smoothing of the mapped finger position."""
         if new_pos is None:
             return None
-        self.position_history.append(new_pos)
-
-        # Stage 1: Moving average (with weighting)
-        if self.position_history:
-            total_weight = 0.0
-            weighted_x = 0.0
-            weighted_y = 0.0
-            
-            for i, pos in enumerate(self.position_history):
-                weight = (i + 1) / len(self.position_history)
-                weighted_x += pos[0] * weight
-                weighted_y += pos[1] * weight
-                total_weight += weight
-            
-            averaged_pos = (weighted_x / total_weight, weighted_y / total_weight)
-        else:
-            averaged_pos = new_pos
-
-        # Stage 2: Exponential smoothing
+        # Single EMA (O(1) per sample); its span matches SMOOTHING_WINDOW
         if self.smooth_pos is None:
-            self.smooth_pos = averaged_pos
+            self.smooth_pos = new_pos
         else:
-            x = self.smooth_pos[0] * (1 - self.smoothing_factor) + averaged_pos[0] * self.smoothing_factor
-            y = self.smooth_pos[1] * (1 - self.smoothing_factor) + averaged_pos[1] * self.smoothing_factor
+            a = self.smoothing_factor
+            sx, sy = self.smooth_pos
+            x = sx + (new_pos[0] - sx) * a
+            y = sy + (new_pos[1] - sy) * a
             self.smooth_pos = (x, y) # Keep as float for precision
 
         return (int(self.smooth_pos[0]), int(self.smooth_pos[1]))
 
     def camera_loop(self):
         """Runs hand tracking in separate thread."""
-        while self.running and self.cap is not None:
-            ret, frame = self.cap.read()
+        while not self._stop.is_set() and self.cap is not None:
+            # grab() only dequeues; the decode happens once, in retrieve(),
+            # for the frame we actually keep.
+            start = time.perf_counter()
+            ret = self.cap.grab()
+            if (ret and not self.cap_buffer_limited
+                    and time.perf_counter() - start < 0.005):
+                # That grab didn't wait, so the driver had frames queued while
+                # we were tracking and this one is stale. Drain the queue and
+                # stop at the first grab that had to wait for the camera (the
+                # newest frame, which is kept). If the first grab waited, the
+                # queue was empty and its frame is already the newest.
+                for _ in range(4):
+                    start = time.perf_counter()
+                    if not self.cap.grab() or time.perf_counter() - start > 0.005:
+                        break
+            if ret:
+                ret, frame = self.cap.retrieve()
             if not ret:
-                time.sleep(0.01)
+                # Only back off on failure, so a dead camera doesn't spin
+                self._stop.wait(0.005)
                 continue
 
             # Hand tracking (do not draw labels here; we'll render labels in pygame)
@@ -227,7 +304,7 @@ class FingerSnakeGame:
                 y_small = int(y * small_h / h)
                 # If the preview is being flipped for full mirroring, mirror the
                 # overlay position so the label follows what the user sees on-screen.
-                if 'CAMERA_MIRROR' in globals() and CAMERA_MIRROR and not ('CAMERA_MIRROR_TEXT_ONLY' in globals() and CAMERA_MIRROR_TEXT_ONLY):
+                if self._mirror and not self._mirror_text_only:
                     x_small = small_w - x_small
                 overlay_pos_small = (x_small, y_small)
             else:
@@ -235,28 +312,33 @@ class FingerSnakeGame:
                 overlay_text = "NO HAND DETECTED"
                 overlay_pos_small = (8, 8)
 
-            with self.frame_lock:
-                self.shared_finger_pos = game_pos
-                self.shared_finger_detected = detected
-                self.latest_overlay_text = overlay_text
-                self.latest_overlay_pos = overlay_pos_small
-                self.latest_overlay_detected = detected
-
             # Update display frame with landmarks drawn. Respect CAMERA_MIRROR.
-            if 'CAMERA_MIRROR' in globals() and CAMERA_MIRROR:
+            if self._mirror:
                 preview_frame = cv2.flip(processed_frame, 1)
             else:
                 preview_frame = processed_frame
-            # Scale preview to a compact size for the info panel
+            # Scale preview to a compact size for the info panel and build its
+            # Surface here; the render thread only blits it into place.
             frame_small = cv2.resize(preview_frame, (240, 180))
+            # Wrap the BGR pixels directly: no colour conversion and no
+            # tobytes() copy. resize() returns a new array each frame and the
+            # Surface keeps a reference to it.
+            camera_surface = pygame.image.frombuffer(frame_small, (240, 180), 'BGR')
+            # Publish everything for this frame in one go: each slot only
+            # ever holds the newest value (a slow render frame just skips
+            # older ones), and the preview, its label and the finger position
+            # are always from the same camera frame.
             with self.frame_lock:
-                self.latest_frame_small = frame_small
-
-            time.sleep(0.01)
+                self.shared_finger_pos = game_pos
+                self.shared_finger_detected = detected
+                self.latest_overlay_text = overlay_text
+                self.latest_overlay_pos = overlay_pos_small
+                self.latest_overlay_detected = detected
+                self.latest_camera_surface = camera_surface
 
     def update_from_shared_state(self):
         """Pull latest tracking data."""
-        frame_small = None
+        camera_surface = None
         finger_pos = None
         finger_detected = False
         overlay_text = None
@@ -264,8 +346,11 @@ class FingerSnakeGame:
         overlay_detected = False
 
         with self.frame_lock:
-            if self.latest_frame_small is not None:
-                frame_small = self.latest_frame_small.copy()
+            # Take ownership of the newest preview; the camera thread builds a
+            # fresh Surface each frame, so no copy is needed and each one is
+            # labelled exactly once.
+            camera_surface = self.latest_camera_surface
+            self.latest_camera_surface = None
             finger_pos = self.shared_finger_pos
             finger_detected = self.shared_finger_detected
             # Grab overlay info set by camera thread
@@ -274,12 +359,20 @@ class FingerSnakeGame:
             overlay_detected = self.latest_overlay_detected
 
         self.finger_detected = finger_detected
+        self.finger_pos = finger_pos
         if finger_pos is not None:
             self.last_finger_pos = finger_pos
 
-        if frame_small is not None:
-            frame_rgb = cv2.cvtColor(frame_small, cv2.COLOR_BGR2RGB)
-            self.camera_surface = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
+        if camera_surface is not None:
+            # Copy the 24-bit preview into a persistent display-format
+            # Surface once per camera frame, so the per-frame blits to the
+            # screen don't convert pixel formats and nothing is allocated.
+            display_surf = self._camera_display
+            if display_surf is None or display_surf.get_size() != camera_surface.get_size():
+                display_surf = self._camera_display = pygame.Surface(
+                    camera_surface.get_size()).convert()
+            display_surf.blit(camera_surface, (0, 0))
+            self.camera_surface = display_surf
             # Draw overlay text onto the camera preview using pygame so we can
             # control mirroring of the labels independently of the image.
             try:
@@ -288,20 +381,22 @@ class FingerSnakeGame:
                     surf_w = self.camera_surface.get_width()
                     surf_h = self.camera_surface.get_height()
 
-                    # Render label:
+                    # Render label (cached; the label text barely changes):
                     label_color = GREEN if overlay_detected else RED
+                    # If configured to mirror only text, flip text surface horizontally
+                    flip = self._mirror_text_only
                     if overlay_text == "INDEX":
                         # use the slightly smaller index font to be less obtrusive
-                        label_surf = self.index_font.render(overlay_text, True, label_color)
+                        label_surf = self.render_text(self.index_font, overlay_text, label_color, flip)
                     elif overlay_text == "NO HAND DETECTED":
                         # monospaced, smaller message so it fits nicely in the
                         # camera preview top-left
                         try:
-                            label_surf = self.mono_tiny_font.render(overlay_text, True, RED)
+                            label_surf = self.render_text(self.mono_tiny_font, overlay_text, RED, flip)
                         except Exception:
-                            label_surf = self.tiny_font.render(overlay_text, True, RED)
+                            label_surf = self.render_text(self.tiny_font, overlay_text, RED, flip)
                     else:
-                        label_surf = self.small_font.render(overlay_text, True, label_color)
+                        label_surf = self.render_text(self.small_font, overlay_text, label_color, flip)
                     label_rect = label_surf.get_rect()
 
                     if overlay_pos:
@@ -309,10 +404,6 @@ class FingerSnakeGame:
                     else:
                         px, py = (10, 24)
 
-                    # If configured to mirror only text, flip text surface horizontally
-                    if 'CAMERA_MIRROR_TEXT_ONLY' in globals() and CAMERA_MIRROR_TEXT_ONLY:
-                        label_surf = pygame.transform.flip(label_surf, True, False)
-
                     # Blit label — keep inside preview bounds
                     blit_x = max(0, min(surf_w - label_rect.width, px))
                     blit_y = max(0, min(surf_h - label_rect.height, py))
@@ -320,11 +411,29 @@ class FingerSnakeGame:
             except Exception:
                 pass
 
+    def render_text(self, font, text, color, flip=False):
+        """Return font.render(text, True, color), cached.
+
+        With flip=True the surface is mirrored horizontally (also cached).
+        """
+        key = (id(font), text, color, flip)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self._text_cache.move_to_end(key)
+            return surface
+        surface = font.render(text, True, color)
+        if flip:
+            surface = pygame.transform.flip(surface, True, False)
+        self._text_cache[key] = surface
+        if len(self._text_cache) > _TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surface
+
     def draw_text(self, text, pos, color=WHITE, font=None):
         """Draw text on screen."""
         if font is None:
             font = self.font
-        text_surface = font.render(text, True, color)
+        text_surface = self.render_text(font, text, color)
         text_rect = text_surface.get_rect(center=pos)
         self.screen.blit(text_surface, text_rect)
 
@@ -333,10 +442,9 @@ class FingerSnakeGame:
 
         Uses GRID_CELL_PX from config to determine spacing and GRID_SCROLL_SPEED to animate.
         """
-        # Fill base only within game area; clear info panel separately
-        # Game area background
+        # Game area background; the opaque grid tiles below cover all of
+        # it, so it only needs a fill when the grid is disabled
         game_area = pygame.Rect(0, 0, GAME_WIDTH, GAME_HEIGHT)
-        self.screen.fill(BLACK, game_area)
         # Info panel background (use configured INFO_PANEL_COLOR)
         info_area = pygame.Rect(GAME_WIDTH, 0, INFO_PANEL_WIDTH, GAME_HEIGHT)
         try:
@@ -347,39 +455,54 @@ class FingerSnakeGame:
 
         cell = GRID_CELL_PX
         if cell <= 0:
+            self.screen.fill(BLACK, game_area)
             return
 
         # Compute offset for animation (creates 'running' effect)
-        t = time.time()
+        t = self.frame_now
         offset = int((t * GRID_SCROLL_SPEED) % cell)
 
+        # The grid repeats every GRID_MAJOR_EVERY cells, so one pre-rendered
+        # tile of that period is blitted across the game area instead of
+        # drawing every line each frame.
+        if self._grid_tile is None:
+            self._grid_tile = self._build_grid_tile(cell)
+            # Tile origins at offset 0, one extra cell wide so they still
+            # cover the area for any offset; only the offset moves per frame.
+            tile_px = self._grid_tile.get_width()
+            self._grid_tile_origins = [
+                (x, y)
+                for y in range(0, GAME_HEIGHT + cell, tile_px)
+                for x in range(0, GAME_WIDTH + cell, tile_px)
+            ]
+        tile = self._grid_tile
+
         # Restrict drawing to the game area so the grid doesn't bleed into
         # the info panel. Use a clip rect for safety across different
         # backends and to avoid off-by-one drawing at the game/info border.
         prev_clip = self.screen.get_clip()
         try:
             self.screen.set_clip(game_area)
-
-            # Vertical lines (only within the game area)
-            for i, x in enumerate(range(-offset, GAME_WIDTH, cell)):
-                # Major every GRID_MAJOR_EVERY
-                if (i % GRID_MAJOR_EVERY) == 0:
-                    color = GRID_MAJOR_LINE_COLOR
-                else:
-                    color = GRID_LINE_COLOR
-                pygame.draw.line(self.screen, color, (x, 0), (x, GAME_HEIGHT))
-
-            # Horizontal lines (only within the game area)
-            for i, y in enumerate(range(-offset, GAME_HEIGHT, cell)):
-                if (i % GRID_MAJOR_EVERY) == 0:
-                    color = GRID_MAJOR_LINE_COLOR
-                else:
-                    color = GRID_LINE_COLOR
-                pygame.draw.line(self.screen, color, (0, y), (GAME_WIDTH, y))
+            self.screen.blits([(tile, (x - offset, y - offset))
+                               for x, y in self._grid_tile_origins], False)
         finally:
             # Restore previous clipping region
             self.screen.set_clip(prev_clip)
 
+    def _build_grid_tile(self, cell):
+        """Render one GRID_MAJOR_EVERY x GRID_MAJOR_EVERY block of grid cells."""
+        tile_px = cell * GRID_MAJOR_EVERY
+        tile = pygame.Surface((tile_px, tile_px)).convert()
+        tile.fill(BLACK)
+        # Vertical lines first, then horizontal (they win at crossings)
+        for i in range(GRID_MAJOR_EVERY):
+            color = GRID_MAJOR_LINE_COLOR if i == 0 else GRID_LINE_COLOR
+            pygame.draw.line(tile, color, (i * cell, 0), (i * cell, tile_px))
+        for i in range(GRID_MAJOR_EVERY):
+            color = GRID_MAJOR_LINE_COLOR if i == 0 else GRID_LINE_COLOR
+            pygame.draw.line(tile, color, (0, i * cell), (tile_px, i * cell))
+        return tile
+
     def draw_menu(self):
         """Draw menu screen."""
         # draw animated grid background
@@ -393,7 +516,7 @@ class FingerSnakeGame:
         if self.finger_detected:
             progress = ""
             if self.menu_detect_start:
-                elapsed = time.time() - self.menu_detect_start
+                elapsed = self.frame_now - self.menu_detect_start
                 progress = f" ({elapsed:.1f}s/{self.transition_delay}s)"
             self.draw_text(f"Finger detected! Starting...{progress}",
                            (GAME_WIDTH // 2, GAME_HEIGHT // 2 + 80),
@@ -417,38 +540,40 @@ class FingerSnakeGame:
         # Draw HUD into the info panel (right side)
         base_x = GAME_WIDTH + 10
         current_y = 10
-        score_text = self.small_font.render(f"Score: {self.score}", True, WHITE)
+        score_text = self.render_text(self.small_font, f"Score: {self.score}", WHITE)
         self.screen.blit(score_text, (base_x, current_y))
         current_y += score_text.get_height() + 8
         
         # Draw Speed Boost Timer
-        if time.time() < self.snake.speed_boost_end_time:
-            time_left = self.snake.speed_boost_end_time - time.time()
-            boost_text = self.small_font.render(f"BOOST: {time_left:.1f}s", True, GOLD)
+        if self.frame_now < self.snake.speed_boost_end_time:
+            time_left = self.snake.speed_boost_end_time - self.frame_now
+            boost_text = self.render_text(self.small_font, f"BOOST: {time_left:.1f}s", GOLD)
             self.screen.blit(boost_text, (base_x, 70))
 
         status_color = GREEN if self.finger_detected else RED
-        status_text = self.small_font.render(
+        status_text = self.render_text(
+            self.small_font,
             "Finger: " + ("Detected" if self.finger_detected else "Not Found"),
-            True, status_color
+            status_color
         )
         self.screen.blit(status_text, (base_x, current_y))
         current_y += status_text.get_height() + 8
 
-        fps_text = self.small_font.render(f"FPS: {int(self.clock.get_fps())}", True, WHITE)
+        fps_text = self.render_text(self.small_font, self._fps_label(), WHITE)
         self.screen.blit(fps_text, (base_x, GAME_HEIGHT - 30))
         # High score display (aligned to right of info panel)
-        hs_text = self.small_font.render(f"High: {self.highscore}", True, WHITE)
+        hs_text = self.render_text(self.small_font, f"High: {self.highscore}", WHITE)
         self.screen.blit(hs_text, (GAME_WIDTH + INFO_PANEL_WIDTH - 110, 10))
 
         # Mute / Pause indicator
         if self.muted:
-            mute_text = self.small_font.render("MUTED", True, RED)
+            mute_text = self.render_text(self.small_font, "MUTED", RED)
             self.screen.blit(mute_text, (GAME_WIDTH + INFO_PANEL_WIDTH - 110, 40))
         if self.paused:
-            pause_text = self.font.render("PAUSED", True, YELLOW)
+            pause_text = self.render_text(self.font, "PAUSED", YELLOW)
             pause_rect = pause_text.get_rect(center=(GAME_WIDTH//2, GAME_HEIGHT//2))
             self.screen.blit(pause_text, pause_rect)
+            self._pause_rect = pause_rect
         
     def draw_border(self):
         """Draw the game border."""
@@ -456,16 +581,52 @@ class FingerSnakeGame:
         border_rect = (0, 0, GAME_WIDTH, GAME_HEIGHT)
         pygame.draw.rect(self.screen, DARK_GREY, border_rect, WALL_COLLISION_MARGIN)
 
+    def _fps_label(self):
+        """Return the "FPS: n" label, refreshed at most 5 times a second."""
+        if self.frame_now >= self._fps_next_update:
+            self._fps_text = f"FPS: {int(self.clock.get_fps())}"
+            self._fps_next_update = self.frame_now + 0.2
+        return self._fps_text
+
     def draw_game_fps(self):
-        """Draw FPS counter in the bottom-left of the game area."""
+        """Draw FPS counter in the bottom-left of the game area.
+
+        Returns the screen Rect drawn to, or None.
+        """
         try:
-            fps = int(self.clock.get_fps())
-            fps_surf = self.small_font.render(f"FPS: {fps}", True, WHITE)
+            fps_surf = self.render_text(self.small_font, self._fps_label(), WHITE)
             # small padding from left and bottom edges
             x = 8
             y = GAME_HEIGHT - fps_surf.get_height() - 8
-            self.screen.blit(fps_surf, (x, y))
+            return self.screen.blit(fps_surf, (x, y))
+        except Exception:
+            return None
+
+    def _build_exit_box(self):
+        """Render the quit prompt on its rounded box into one sprite."""
+        msg = "Quit? Press Y to confirm, N or Esc to cancel"
+        # Use small font so it fits across different resolutions
+        text_surf = self.small_font.render(msg, True, WHITE)
+        text_rect = text_surf.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2))
+        # Draw a slightly brighter box behind the text for clarity
+        pad = 12
+        box = pygame.Surface((text_rect.width + pad * 2, text_rect.height + pad * 2),
+                             pygame.SRCALPHA).convert_alpha()
+        box.fill((0, 0, 0, 0))
+        pygame.draw.rect(box, (40, 40, 40), box.get_rect(), border_radius=6)
+        box.blit(text_surf, (pad, pad))
+        self._exit_box = box
+        self._exit_box_pos = (text_rect.left - pad, text_rect.top - pad)
+
+    def draw_exit_modal(self):
+        """Dim the game area and draw the quit confirmation prompt."""
+        try:
+            if self._exit_box is None:
+                self._build_exit_box()
+            self.screen.blit(self._modal_overlay, (0, 0))  # semi-transparent dark overlay
+            self.screen.blit(self._exit_box, self._exit_box_pos)
         except Exception:
+            # If anything goes wrong drawing the overlay, still allow exit
             pass
 
     def run(self):
@@ -474,8 +635,18 @@ class FingerSnakeGame:
             self.cleanup()
             return
             
+        # Bind the per-frame calls once; the loop body looks them up
+        # several times every frame.
+        monotonic = time.monotonic
+        get_events = pygame.event.get
+        flip = pygame.display.flip
+        tick = self.clock.tick
+        screen_blit = self.screen.blit
+
         while self.running:
-            for event in pygame.event.get():
+            # One clock read per frame, passed down to the snake and foods.
+            now = self.frame_now = monotonic()
+            for event in get_events():
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN:
@@ -527,26 +698,13 @@ class FingerSnakeGame:
                     cam_height = self.camera_surface.get_height()
                     cam_x = GAME_WIDTH + 10
                     cam_y = GAME_HEIGHT - cam_height - 10
-                    self.screen.blit(self.camera_surface, (cam_x, cam_y))
+                    screen_blit(self.camera_surface, (cam_x, cam_y))
 
-                    # Draw confirmation modal centered over game area
-                try:
-                    overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-                    overlay.fill((0, 0, 0, 160))
-                    self.screen.blit(overlay, (0, 0))
-                    msg = "Quit? Press Y to confirm, N or Esc to cancel"
-                    text_surf = self.small_font.render(msg, True, WHITE)
-                    text_rect = text_surf.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2))
-                    pad = 12
-                    box_rect = pygame.Rect(text_rect.left - pad, text_rect.top - pad,
-                                            text_rect.width + pad * 2, text_rect.height + pad * 2)
-                    pygame.draw.rect(self.screen, (40, 40, 40), box_rect, border_radius=6)
-                    self.screen.blit(text_surf, text_rect)
-                except Exception:
-                    pass
+                # Draw confirmation modal centered over game area
+                self.draw_exit_modal()
 
-                pygame.display.flip()
-                self.clock.tick(FPS)
+                flip()
+                tick(FPS)
                 continue
 
             # Draw game border first
@@ -556,22 +714,18 @@ class FingerSnakeGame:
                 self.draw_menu()
 
                 # Menu logic
-                if self.finger_detected and self.shared_finger_pos is not None:
+                if self.finger_detected and self.finger_pos is not None:
                     if self.menu_detect_start is None:
-                        self.menu_detect_start = time.time()
-                    elif time.time() - self.menu_detect_start >= self.transition_delay:
+                        self.menu_detect_start = now
+                    elif now - self.menu_detect_start >= self.transition_delay:
                         self.game_state = "PLAYING"
                         self.snake.reset()
                         self.score = 0
                         for food in self.foods: # Respawn all foods
-                             food.respawn(self.snake.segments)
+                             food.respawn(self.snake.segments, now)
                         self.menu_detect_start = None
                         # play start sound
-                        try:
-                            if not self.muted and 'start' in self.sounds:
-                                self.sounds['start'].play()
-                        except Exception:
-                            pass
+                        self._play('start')
                 else:
                     self.menu_detect_start = None
 
@@ -586,65 +740,64 @@ class FingerSnakeGame:
                         # Place camera preview inside the info panel
                         cam_x = GAME_WIDTH + 10
                         cam_y = GAME_HEIGHT - cam_height - 10
-                        self.screen.blit(self.camera_surface, (cam_x, cam_y))
+                        screen_blit(self.camera_surface, (cam_x, cam_y))
                     # Draw FPS in bottom-left of game area when paused
-                    self.draw_game_fps()
-                    # Draw FPS in bottom-left when showing confirmation modal
-                    self.draw_game_fps()
-                    pygame.display.flip()
-                    self.clock.tick(FPS)
+                    fps_rect = self.draw_game_fps()
+                    # The game area is frozen while paused, so only present
+                    # what changes: the info panel, the PAUSED label and FPS.
+                    dirty = [self._info_rect, self._pause_rect]
+                    if fps_rect is not None:
+                        dirty.append(fps_rect)
+                    pygame.display.update(dirty)
+                    tick(FPS)
                     continue
                 # draw grid background and border
                 self.draw_background()
                 self.draw_border()
 
                 # Bonus Food Spawn Logic
-                if len(self.foods) < 2 and time.time() >= self.bonus_food_spawn_timer:
-                    new_bonus_food = BonusFood()
-                    new_bonus_food.respawn(self.snake.segments)
-                    self.foods.append(new_bonus_food)
-                    self.bonus_food_spawn_timer = time.time() + random.uniform(20.0, 30.0)
+                if len(self.foods) < 2 and now >= self.bonus_food_spawn_timer:
+                    self._bonus_food.respawn(self.snake.segments, now)
+                    self.foods.append(self._bonus_food)
+                    self.bonus_food_spawn_timer = now + random.uniform(20.0, 30.0)
 
                 # Update & Draw Foods
                 for food in self.foods:
-                    food.update()
+                    food.update(now)
                     food.draw(self.screen)
 
                 # Update Snake
                 if self.finger_detected and self.last_finger_pos:
-                    self.snake.update(self.last_finger_pos)
+                    self.snake.update(self.last_finger_pos, now)
 
                 # Check Collisions
-                head = self.snake.segments[0]
+                # Plain floats: the per-food tests below then do no NumPy
+                # scalar arithmetic.
+                head = self.snake.segments[0].tolist()
                 
-                # Food Collision
-                for food in list(self.foods):
+                # Food Collision (reverse index scan: eaten bonus food can be
+                # popped in place without copying the list)
+                foods = self.foods
+                i = len(foods) - 1
+                while i >= 0:
+                    food = foods[i]
                     if food.check_collision(head):
                         self.score += food.score
                         self.snake.grow(food.score * GROWTH_RATE)
                         # play eat/bonus sound
-                        try:
-                            if not self.muted and ('bonus' in self.sounds or 'eat' in self.sounds):
-                                if food.is_bonus and 'bonus' in self.sounds:
-                                    self.sounds['bonus'].play()
-                                elif not food.is_bonus and 'eat' in self.sounds:
-                                    self.sounds['eat'].play()
-                        except Exception:
-                            pass
+                        self._play('bonus' if food.is_bonus else 'eat')
 
                         if food.is_bonus:
-                            self.snake.activate_boost(food.boost_duration)
-                            try:
-                                self.foods.remove(food) # Remove bonus food immediately
-                            except ValueError:
-                                pass
+                            self.snake.activate_boost(food.boost_duration, now)
+                            foods.pop(i) # Remove bonus food immediately
                         else:
-                            food.respawn(self.snake.segments)
+                            food.respawn(self.snake.segments, now)
+                    i -= 1
 
                 # Game Over Collision (Wall or Self)
                 if self.snake.check_self_collision() or self.snake.check_wall_collision():
                     self.game_state = "GAME_OVER"
-                    self.flash_timer = time.time() + 0.5 # Flash screen red for 0.5s
+                    self.flash_timer = now + 0.5 # Flash screen red for 0.5s
                     self.gameover_detect_start = None
                     # Update highscore if beaten
                     try:
@@ -654,13 +807,9 @@ class FingerSnakeGame:
                     except Exception:
                         pass
                     # play death sound
-                    try:
-                        if not self.muted and 'die' in self.sounds:
-                            self.sounds['die'].play()
-                    except Exception:
-                        pass
+                    self._play('die')
 
-                self.snake.draw(self.screen)
+                self.snake.draw(self.screen, now)
                 self.draw_hud()
 
                 # Draw smooth pointer
@@ -669,26 +818,24 @@ class FingerSnakeGame:
                     pygame.draw.circle(self.screen, WHITE, self.last_finger_pos, 3)
                     
                 # Collision Flash Effect
-                if time.time() < self.flash_timer:
-                    flash_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-                    flash_surface.fill((255, 0, 0, 100)) # Semi-transparent red
-                    self.screen.blit(flash_surface, (0, 0))
+                if now < self.flash_timer:
+                    screen_blit(self._flash_surface, (0, 0)) # Semi-transparent red
 
             elif self.game_state == "GAME_OVER":
                 self.draw_game_over()
                 
                 # Game Over Transition Logic
-                if self.finger_detected and self.shared_finger_pos is not None:
+                if self.finger_detected and self.finger_pos is not None:
                     if self.gameover_detect_start is None:
-                        self.gameover_detect_start = time.time()
-                    elif time.time() - self.gameover_detect_start >= self.transition_delay:
+                        self.gameover_detect_start = now
+                    elif now - self.gameover_detect_start >= self.transition_delay:
                         self.game_state = "PLAYING"
                         self.snake.reset()
                         self.score = 0
                         # Re-initialize all foods
-                        self.foods = [RegularFood()]
-                        self.foods[0].respawn(self.snake.segments)
-                        self.bonus_food_spawn_timer = time.time() + 15.0 
+                        self._regular_food.respawn(self.snake.segments, now)
+                        self.foods = [self._regular_food]
+                        self.bonus_food_spawn_timer = now + 15.0 
                         self.gameover_detect_start = None
                 else:
                     self.gameover_detect_start = None
@@ -700,39 +847,25 @@ class FingerSnakeGame:
                 # Place camera preview inside the info panel (left-aligned)
                 cam_x = GAME_WIDTH + 10
                 cam_y = GAME_HEIGHT - cam_height - 10
-                self.screen.blit(self.camera_surface, (cam_x, cam_y))
+                screen_blit(self.camera_surface, (cam_x, cam_y))
             # If exit confirmation is active, draw a modal confirmation overlay
             if self.exit_confirmation:
-                try:
-                    overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-                    overlay.fill((0, 0, 0, 160))  # semi-transparent dark overlay
-                    self.screen.blit(overlay, (0, 0))
-
-                    msg = "Quit? Press Y to confirm, N or Esc to cancel"
-                    # Use small font so it fits across different resolutions
-                    text_surf = self.small_font.render(msg, True, WHITE)
-                    text_rect = text_surf.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2))
-                    # Draw a slightly brighter box behind the text for clarity
-                    pad = 12
-                    box_rect = pygame.Rect(text_rect.left - pad, text_rect.top - pad,
-                                            text_rect.width + pad * 2, text_rect.height + pad * 2)
-                    pygame.draw.rect(self.screen, (40, 40, 40), box_rect, border_radius=6)
-                    self.screen.blit(text_surf, text_rect)
-                except Exception:
-                    # If anything goes wrong drawing the overlay, still allow exit
-                    pass
+                self.draw_exit_modal()
 
             # Draw FPS in bottom-left of the game area
             self.draw_game_fps()
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            flip()
+            tick(FPS)
 
         self.cleanup()
 
     def cleanup(self):
         """Clean up resources."""
         self.running = False
+        self._stop.set()
         try:
+            # Join before releasing the capture: VideoCapture isn't safe to
+            # release while another thread is inside grab()/retrieve().
             if self.camera_thread and self.camera_thread.is_alive():
                 self.camera_thread.join(timeout=1.0)
         except:
@@ -1,12 +1,12 @@
 import sys, os
 
+# Resolved once: the bundle dir when running from inside .app or .exe
+# (PyInstaller), otherwise the working directory (VS Code / Terminal).
+_RESOURCE_BASE = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller."""
-    if hasattr(sys, '_MEIPASS'):
-        # Running from inside .app or .exe
-        return os.path.join(sys._MEIPASS, relative_path)
-    # Running normally (VS Code / Terminal)
-    return os.path.join(os.path.abspath("."), relative_path)
+    return os.path.join(_RESOURCE_BASE, relative_path)
 
 # Make the resource_path function globally available inside game modules
 # (so utils, snake, audio, etc. can import it)